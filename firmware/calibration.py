@@ -8,6 +8,7 @@ Organization: St. Clair College Robotics Club
 License: MIT
 """
 
+import json
 from utils import debug_print
 
 
@@ -21,6 +22,7 @@ class CalibrationData:
         self.steering_trim = 0.0  # Steering offset (-0.2 to +0.2)
         self.motor_left_scale = 1.0  # Left motor power multiplier (0.5 to 1.0)
         self.motor_right_scale = 1.0  # Right motor power multiplier (0.5 to 1.0)
+        self._json = None  # Cached to_json() result, dropped on every change
     
     def to_dict(self):
         """
@@ -35,6 +37,20 @@ class CalibrationData:
             "motor_right_scale": self.motor_right_scale
         }
     
+    def to_json(self):
+        """
+        Get calibration as a JSON object string.
+        
+        The string is encoded once and reused until the calibration changes,
+        so callers may also compare it by identity to detect changes.
+        
+        Returns:
+            JSON string of to_dict()
+        """
+        if self._json is None:
+            self._json = json.dumps(self.to_dict())
+        return self._json
+    
     def from_dict(self, data):
         """
         Load calibration from dictionary.
@@ -50,12 +66,14 @@ class CalibrationData:
         self.steering_trim = max(-0.2, min(0.2, self.steering_trim))
         self.motor_left_scale = max(0.5, min(1.0, self.motor_left_scale))
         self.motor_right_scale = max(0.5, min(1.0, self.motor_right_scale))
+        self._json = None
     
     def reset(self):
         """Reset to default calibration values."""
         self.steering_trim = 0.0
         self.motor_left_scale = 1.0
         self.motor_right_scale = 1.0
+        self._json = None
         debug_print("Calibration reset to defaults")
 
 
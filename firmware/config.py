@@ -8,14 +8,16 @@ Organization: St. Clair College Robotics Club
 License: MIT
 """
 
+from micropython import const
+
 # ============================================================================
 # NETWORK CONFIGURATION
 # ============================================================================
 
 WIFI_SSID = "DevNet-2.4G"
 WIFI_PASSWORD = "DevPass**99"
-WIFI_TIMEOUT_MS = 15000  # 15 seconds to connect
-WIFI_RETRY_DELAY_MS = 5000  # 5 seconds between retries
+WIFI_TIMEOUT_MS = const(15000)  # 15 seconds to connect
+WIFI_RETRY_DELAY_MS = const(5000)  # 5 seconds between retries
 
 # Network port
 WEBSOCKET_PORT = 8765
@@ -47,13 +49,13 @@ MDNS_ENABLED = True
 # SAFETY & TIMING
 # ============================================================================
 
-WATCHDOG_TIMEOUT_MS = 500  # Stop motors if no packet for 500ms (increased from 200ms)
+WATCHDOG_TIMEOUT_MS = const(500)  # Stop motors if no packet for 500ms (increased from 200ms)
 CONTROL_RATE_HZ = 30  # Expected control packet rate
-MAIN_LOOP_MS = 50  # Main loop update rate
+MAIN_LOOP_MS = const(50)  # Main loop update rate
 
 # LCD Configuration
 LCD_ENABLED = True  # Re-enabled now that motors are fixed
-LCD_UPDATE_INTERVAL_MS = 100  # Update LCD every 100ms (10 Hz)
+LCD_UPDATE_INTERVAL_MS = const(100)  # Update LCD every 100ms (10 Hz)
 
 # ============================================================================
 # MOTOR DRIVER (TB6612FNG) - Pin Definitions
@@ -217,27 +217,14 @@ class LCDStatus:
         if not self.display:
             return
         
-        prev_state = self.current_state
+        if state == STATE_DRIVING:
+            self.set_driving(kwargs.get('throttle', 0), kwargs.get('steer', 0))
+            return
+        
         self.current_state = state
         
         # Update data immediately
-        if state == STATE_DRIVING:
-            self.throttle = kwargs.get('throttle', 0)
-            self.steer = kwargs.get('steer', 0)
-            # ALWAYS update packet time when driving (needed for connection status indicators)
-            self.last_packet_time = time.ticks_ms()
-            self.packets_received += 1
-            
-            # Show "ACTIVE DRIVING" screen on first transition to driving OR when recovering from any other state
-            if prev_state != STATE_DRIVING:
-                try:
-                    self._show_driving_active()
-                except Exception as e:
-                    debug_print(f"Drive active screen error: {e}")
-            
-            # CRITICAL: Do NOT update display during driving - causes 23ms latency!
-            return
-        elif state == STATE_NET_UP:
+        if state == STATE_NET_UP:
             self.ip_address = kwargs.get('ip', None)
             self.rssi = kwargs.get('rssi', None)
         
@@ -256,6 +243,33 @@ class LCDStatus:
         except Exception as e:
             debug_print(f"State display error: {e}")
     
+    def set_driving(self, throttle=0, steer=0):
+        """
+        Enter (or stay in) DRIVING state with the latest axis values.
+        
+        Same as set_state(STATE_DRIVING, throttle=..., steer=...) but with
+        positional arguments, so the drive path builds no kwargs dict.
+        """
+        if not self.display:
+            return
+        
+        prev_state = self.current_state
+        self.current_state = STATE_DRIVING
+        self.throttle = throttle
+        self.steer = steer
+        # ALWAYS update packet time when driving (needed for connection status indicators)
+        self.last_packet_time = time.ticks_ms()
+        self.packets_received += 1
+        
+        # Show "ACTIVE DRIVING" screen on first transition to driving OR when recovering from any other state
+        if prev_state != STATE_DRIVING:
+            try:
+                self._show_driving_active()
+            except Exception as e:
+                debug_print(f"Drive active screen error: {e}")
+        
+        # CRITICAL: Do NOT update display during driving - causes 23ms latency!
+    
     def _draw_large_text(self, text, x, y, color, scale=2):
         """Draw larger text by drawing each character multiple times with offset."""
         for i in range(scale):
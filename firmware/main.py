@@ -225,6 +225,10 @@ async def main():
 
 # Entry point
 # Note: MicroPython always runs main.py, so __name__ is always "__main__"
+# Note: The event loop is MicroPython's built-in uasyncio scheduler. uvloop
+# (a faster CPython loop) can't be swapped in: it is a CPython C extension,
+# and this firmware needs MicroPython-only modules (machine, network,
+# micropython, uasyncio), so it never runs under CPython anyway.
 try:
     # Run the async main function
     asyncio.run(main())
@@ -19,6 +19,13 @@ from utils import clamp, debug_print
 import calibration
 
 
+# Speed magnitude (0.0-1.0) to PWM duty conversion, specialised at import.
+# MOTOR_MAX_DUTY is fixed per build, so it is bound as a default argument
+# (a fast local) instead of scaling through a percentage on every call.
+def _speed_to_duty(mag, _max_duty=MOTOR_MAX_DUTY):
+    return int(mag * _max_duty)
+
+
 class Motor:
     """Individual motor controller matching Waveshare implementation."""
     
@@ -47,9 +54,8 @@ class Motor:
             self.stop()
             return
         
-        # Convert to percent and duty cycle
-        speed_percent = abs(speed) * 100
-        duty = int(speed_percent * MOTOR_MAX_DUTY / 100)
+        # Convert magnitude to duty cycle
+        duty = _speed_to_duty(abs(speed))
         
         # Set PWM duty FIRST (critical - Waveshare order)
         self.pwm.duty_u16(duty)
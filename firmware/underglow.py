@@ -55,6 +55,7 @@ class UnderglowController:
         self.num = UNDERGLOW_NUM_LEDS
         self.sm = None
         self.ar = None
+        self._ar_grb = 0  # GRB word currently held in every slot of self.ar
         self.robot_color = ROBOT_COLOR  # RGB tuple (0-255, 0-255, 0-255)
         self.current_state = None
         self.flash_state = False  # False = robot color, True = red
@@ -99,8 +100,12 @@ class UnderglowController:
             # WS2812 expects GRB format
             grb_value = (g << 16) | (r << 8) | b
             
-            for i in range(self.num):
-                self.ar[i] = grb_value
+            # Refill the word array only when the color changed
+            if grb_value != self._ar_grb:
+                ar = self.ar
+                for i in range(self.num):
+                    ar[i] = grb_value
+                self._ar_grb = grb_value
             
             # Send to LEDs
             self.sm.put(self.ar, 8)
@@ -8,10 +8,20 @@ Organization: St. Clair College Robotics Club
 License: MIT
 """
 
+import array
+import math
+import micropython
 import time
 from config import DEBUG_MODE
 
+# Bound once so hot paths skip the module attribute lookup
+_ticks_ms = time.ticks_ms
+_ticks_diff = time.ticks_diff
 
+
+# Numeric helpers below run per axis on every control packet, so they are
+# compiled to machine code with @micropython.native.
+@micropython.native
 def clamp(value, min_val, max_val):
     """
     Clamp a value between min and max.
@@ -27,10 +37,39 @@ def clamp(value, min_val, max_val):
     return max(min_val, min(max_val, value))
 
 
+@micropython.viper
+def clamp_i(value: int, min_val: int, max_val: int) -> int:
+    """
+    Clamp an integer between min and max (viper-compiled integer variant).
+    
+    Args:
+        value: Integer to clamp
+        min_val: Minimum allowed value
+        max_val: Maximum allowed value
+    
+    Returns:
+        Clamped integer
+    """
+    if value < min_val:
+        return min_val
+    if value > max_val:
+        return max_val
+    return value
+
+
+# Rescale factor for the default deadzone, precomputed for the hot path
+_INV_ONE_MINUS_DZ = 1.0 / (1.0 - 0.08)
+
+
+@micropython.native
 def apply_deadzone(value, threshold=0.08):
     """
     Apply deadzone to joystick input.
     
+    Inputs inside the deadzone become 0.0; the remaining range is rescaled
+    so the output ramps smoothly from 0.0 at the threshold to 1.0 at full
+    deflection (no jump at the deadzone edge).
+    
     Args:
         value: Input value (typically -1.0 to 1.0)
         threshold: Deadzone threshold
@@ -38,11 +77,13 @@ def apply_deadzone(value, threshold=0.08):
     Returns:
         Value with deadzone applied
     """
-    if abs(value) < threshold:
-        return 0.0
-    return value
+    mag = abs(value)
+    if threshold == 0.08:
+        return 0.0 if mag < 0.08 else math.copysign((mag - 0.08) * _INV_ONE_MINUS_DZ, value)
+    return 0.0 if mag < threshold else math.copysign((mag - threshold) / (1.0 - threshold), value)
 
 
+@micropython.native
 def map_range(value, in_min, in_max, out_min, out_max):
     """
     Map a value from one range to another.
@@ -60,17 +101,39 @@ def map_range(value, in_min, in_max, out_min, out_max):
     return (value - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
 
 
-def debug_print(message, force=False):
+def debug_print_always(message):
     """
-    Print debug message if DEBUG_MODE is enabled.
+    Print a timestamped message regardless of DEBUG_MODE.
     
     Args:
         message: Message to print
-        force: Force print even if DEBUG_MODE is False
     """
-    if DEBUG_MODE or force:
-        timestamp = time.ticks_ms()
-        print(f"[{timestamp}] {message}")
+    print("[%d] %s" % (_ticks_ms(), message))
+
+
+# debug_print is chosen once at import so production builds skip the
+# DEBUG_MODE test on every call
+if DEBUG_MODE:
+    def debug_print(message, force=False):
+        """
+        Print debug message (DEBUG_MODE is enabled).
+        
+        Args:
+            message: Message to print
+            force: Ignored - all messages print in debug mode
+        """
+        print("[%d] %s" % (_ticks_ms(), message))
+else:
+    def debug_print(message, force=False):
+        """
+        Print debug message only when forced (DEBUG_MODE is disabled).
+        
+        Args:
+            message: Message to print
+            force: Print even though DEBUG_MODE is False
+        """
+        if force:
+            print("[%d] %s" % (_ticks_ms(), message))
 
 
 def format_ip(ip_tuple):
@@ -83,7 +146,7 @@ def format_ip(ip_tuple):
     Returns:
         IP address as string (e.g., "10.42.0.123")
     """
-    return ".".join(str(x) for x in ip_tuple)
+    return "%d.%d.%d.%d" % ip_tuple
 
 
 def get_uptime_ms():
@@ -125,15 +188,21 @@ class RateLimiter:
         self.interval_ms = interval_ms
         self.last_call = 0
     
-    def ready(self):
+    def ready(self, now=None):
         """
         Check if enough time has passed since last call.
         
+        Args:
+            now: Timestamp to check against (defaults to the current
+                time; pass one ticks_ms() sample to several limiters so
+                they all see the same time)
+        
         Returns:
             True if ready to execute
         """
-        now = time.ticks_ms()
-        if time_diff_ms(self.last_call, now) >= self.interval_ms:
+        if now is None:
+            now = _ticks_ms()
+        if _ticks_diff(now, self.last_call) >= self.interval_ms:
             self.last_call = now
             return True
         return False
@@ -143,9 +212,48 @@ class RateLimiter:
         self.last_call = 0
 
 
+class LinearMap:
+    """
+    Precomputed linear range mapping.
+    
+    Equivalent to map_range() with fixed ranges, but the scale and offset
+    are computed once so each call is a single multiply-add. Use for axes
+    whose ranges stay constant for the whole session.
+    """
+    
+    def __init__(self, in_min, in_max, out_min, out_max):
+        """
+        Initialize range mapping.
+        
+        Args:
+            in_min: Input range minimum
+            in_max: Input range maximum
+            out_min: Output range minimum
+            out_max: Output range maximum
+        """
+        self.scale = (out_max - out_min) / (in_max - in_min)
+        self.bias = out_min - in_min * self.scale
+    
+    @micropython.native
+    def __call__(self, value):
+        """
+        Map a value from the input range to the output range.
+        
+        Args:
+            value: Input value
+        
+        Returns:
+            Mapped value
+        """
+        return value * self.scale + self.bias
+
+
 class MovingAverage:
     """
     Calculate moving average for smoothing values.
+    
+    Samples live in a fixed-size float ring buffer, so no allocation
+    happens after construction.
     """
     
     def __init__(self, size=5):
@@ -156,7 +264,10 @@ class MovingAverage:
             size: Number of samples to average
         """
         self.size = size
-        self.values = []
+        self.buf = array.array("f", [0.0] * size)
+        self.idx = 0
+        self.count = 0
+        self.total = 0.0
     
     def add(self, value):
         """
@@ -168,22 +279,27 @@ class MovingAverage:
         Returns:
             Current moving average
         """
-        self.values.append(value)
-        if len(self.values) > self.size:
-            self.values.pop(0)
-        return sum(self.values) / len(self.values)
+        # Overwrite the oldest sample once the window is full
+        old = self.buf[self.idx] if self.count == self.size else 0.0
+        self.total += value - old
+        self.buf[self.idx] = value
+        self.idx = (self.idx + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+        return self.total / self.count
     
     def reset(self):
         """Clear all stored values."""
-        self.values = []
+        self.idx = 0
+        self.count = 0
+        self.total = 0.0
     
     def get_average(self):
         """
         Get current average without adding new value.
         
         Returns:
-            Current moving average or 0 if no values
+            Current moving average or 0.0 if no values
         """
-        if not self.values:
-            return 0
-        return sum(self.values) / len(self.values)
+        # total is 0.0 while empty, so dividing by 1 yields 0.0
+        return self.total / (self.count or 1)
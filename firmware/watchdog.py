@@ -10,8 +10,19 @@ License: MIT
 
 import time
 import uasyncio as asyncio
+from micropython import const
 from config import WATCHDOG_TIMEOUT_MS, STATE_LINK_LOST, STATE_DRIVING
-from utils import debug_print, time_diff_ms
+from utils import debug_print, debug_print_always
+
+# Bound once so the monitor loop skips the module attribute lookup
+_ticks_ms = time.ticks_ms
+_ticks_diff = time.ticks_diff
+_ticks_add = time.ticks_add
+
+# Monitor loop intervals
+_POLL_MS = const(50)        # Timeout check (responsive motor stop)
+_IDLE_POLL_MS = const(500)  # Timeout check while disabled
+_HOUSEKEEP_MS = const(500)  # Display/underglow state sync
 
 
 class Watchdog:
@@ -35,10 +46,21 @@ class Watchdog:
         self.lcd_display = lcd_display
         self.underglow = underglow
         self.last_packet_time = 0
+        self.touched = False  # Set by feed(), folded into last_packet_time by check_timeout()
         self.timeout_ms = WATCHDOG_TIMEOUT_MS
         self.enabled = False
         self.timed_out = False
         self.packet_count = 0
+        self.stats_enabled = False  # Count packets in feed() only when requested
+        
+        # Reused by get_status() so status polls don't allocate
+        self._status = {
+            "enabled": False,
+            "timed_out": False,
+            "elapsed_ms": 0,
+            "timeout_ms": self.timeout_ms,
+            "packets_received": 0
+        }
         
         debug_print(f"Watchdog initialized (timeout: {self.timeout_ms}ms)")
     
@@ -56,16 +78,19 @@ class Watchdog:
     
     def feed(self):
         """
-        Feed the watchdog (update last packet time).
+        Feed the watchdog (mark a packet as received).
         
-        Call this whenever a valid control packet is received.
+        Call this whenever a valid control packet is received. Only a flag
+        is set here; check_timeout() converts it into a timestamp on its
+        next pass, which is at most one monitor interval late.
         """
-        self.last_packet_time = time.ticks_ms()
-        self.packet_count += 1
+        self.touched = True
+        if self.stats_enabled:
+            self.packet_count += 1
         
         # If we were timed out, recover
         if self.timed_out:
-            debug_print("Watchdog: Communication recovered", force=True)
+            debug_print_always("Watchdog: Communication recovered")
             self.timed_out = False
             if self.lcd_display and self.motor_controller:
                 self.lcd_display.set_state(STATE_DRIVING)
@@ -83,8 +108,13 @@ class Watchdog:
         if not self.enabled:
             return False
         
-        now = time.ticks_ms()
-        elapsed = time_diff_ms(self.last_packet_time, now)
+        now = _ticks_ms()
+        if self.touched:
+            self.touched = False
+            self.last_packet_time = now
+            return self.timed_out
+        
+        elapsed = _ticks_diff(now, self.last_packet_time)
         
         if elapsed > self.timeout_ms and not self.timed_out:
             self._handle_timeout()
@@ -94,7 +124,7 @@ class Watchdog:
     
     def _handle_timeout(self):
         """Handle timeout event - stop motors and update display."""
-        debug_print("WATCHDOG TIMEOUT: Stopping motors", force=True)
+        debug_print_always("WATCHDOG TIMEOUT: Stopping motors")
         self.timed_out = True
         
         # Stop motors immediately
@@ -109,23 +139,47 @@ class Watchdog:
         if self.underglow:
             self.underglow.set_state(STATE_LINK_LOST)
     
+    def _housekeep(self):
+        """
+        Background upkeep, run at a coarser rate than timeout checks.
+        
+        While timed out, re-assert LINK_LOST on the display and underglow in
+        case another module changed their state in the meantime.
+        """
+        if not self.timed_out:
+            return
+        
+        if self.lcd_display and self.lcd_display.current_state != STATE_LINK_LOST:
+            self.lcd_display.set_state(STATE_LINK_LOST)
+        
+        if self.underglow and self.underglow.current_state != STATE_LINK_LOST:
+            self.underglow.set_state(STATE_LINK_LOST)
+    
     def get_status(self):
         """
         Get watchdog status.
         
+        The same dictionary is updated in place and returned on every call;
+        copy it if a snapshot is needed.
+        
         Returns:
             Dictionary with watchdog status
         """
-        now = time.ticks_ms()
-        elapsed = time_diff_ms(self.last_packet_time, now)
-        
-        return {
-            "enabled": self.enabled,
-            "timed_out": self.timed_out,
-            "elapsed_ms": elapsed,
-            "timeout_ms": self.timeout_ms,
-            "packets_received": self.packet_count
-        }
+        s = self._status
+        s["enabled"] = self.enabled
+        s["timed_out"] = self.timed_out
+        s["elapsed_ms"] = 0 if self.touched else _ticks_diff(_ticks_ms(), self.last_packet_time)
+        s["timeout_ms"] = self.timeout_ms
+        s["packets_received"] = self.packet_count
+        return s
+    
+    def enable_stats(self):
+        """Start counting received packets (reported as packets_received)."""
+        self.stats_enabled = True
+    
+    def disable_stats(self):
+        """Stop counting received packets to keep feed() minimal."""
+        self.stats_enabled = False
     
     def reset_statistics(self):
         """Reset packet count and statistics."""
@@ -138,15 +192,34 @@ class Watchdog:
         
         Continuously checks for timeout and handles safety.
         Run this as a background task.
+        
+        Timeout checks and housekeeping run on independent deadlines; the
+        loop sleeps until whichever is due first.
         """
         debug_print("Watchdog monitor loop started")
         
+        next_check = _ticks_ms()
+        next_housekeep = next_check
+        
         while True:
-            if self.enabled:
-                self.check_timeout()
+            now = _ticks_ms()
+            
+            if _ticks_diff(now, next_check) >= 0:
+                # Back off only while disabled. A latched timeout keeps the
+                # normal rate: feed() can recover at any moment, and the
+                # next check must stamp that packet promptly.
+                if self.enabled:
+                    self.check_timeout()
+                    next_check = _ticks_add(now, _POLL_MS)
+                else:
+                    next_check = _ticks_add(now, _IDLE_POLL_MS)
             
-            # Check every 50ms for responsive timeout detection
-            await asyncio.sleep_ms(50)
+            if _ticks_diff(now, next_housekeep) >= 0:
+                self._housekeep()
+                next_housekeep = _ticks_add(now, _HOUSEKEEP_MS)
+            
+            sleep_ms = min(_ticks_diff(next_check, now), _ticks_diff(next_housekeep, now))
+            await asyncio.sleep_ms(max(0, sleep_ms))
 
 
 class SafetyController:
@@ -170,6 +243,14 @@ class SafetyController:
         self.e_stop_active = False
         self.startup_complete = False
         
+        # Reused by get_status() so status polls don't allocate
+        self._status = {
+            "startup_complete": False,
+            "e_stop_active": False,
+            "watchdog": None,
+            "motor_enabled": False
+        }
+        
         debug_print("Safety controller initialized")
     
     def startup_complete_ok(self):
@@ -186,7 +267,7 @@ class SafetyController:
         Args:
             reason: Reason for E-stop
         """
-        debug_print(f"E-STOP TRIGGERED: {reason}", force=True)
+        debug_print_always(f"E-STOP TRIGGERED: {reason}")
         self.e_stop_active = True
         
         # Stop motors immediately
@@ -205,7 +286,7 @@ class SafetyController:
         if not self.e_stop_active:
             return
         
-        debug_print("E-stop cleared - resuming operation", force=True)
+        debug_print_always("E-stop cleared - resuming operation")
         self.e_stop_active = False
         
         # Re-enable systems
@@ -237,15 +318,18 @@ class SafetyController:
         """
         Get comprehensive safety status.
         
+        The same dictionary is updated in place and returned on every call;
+        copy it if a snapshot is needed.
+        
         Returns:
             Dictionary with all safety system states
         """
-        return {
-            "startup_complete": self.startup_complete,
-            "e_stop_active": self.e_stop_active,
-            "watchdog": self.watchdog.get_status(),
-            "motor_enabled": self.motor_controller.enabled if self.motor_controller else False
-        }
+        s = self._status
+        s["startup_complete"] = self.startup_complete
+        s["e_stop_active"] = self.e_stop_active
+        s["watchdog"] = self.watchdog.get_status()
+        s["motor_enabled"] = self.motor_controller.enabled if self.motor_controller else False
+        return s
 
 
 # Global safety controller instance
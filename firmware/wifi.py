@@ -11,6 +11,7 @@ License: MIT
 import network
 import time
 import uasyncio as asyncio
+from micropython import const
 from config import (
     WIFI_SSID,
     WIFI_PASSWORD,
@@ -19,7 +20,28 @@ from config import (
     MDNS_HOSTNAME,
     MDNS_ENABLED
 )
-from utils import debug_print, format_ip, time_diff_ms
+from utils import debug_print, format_ip
+
+# How long is_connected()/get_status() reuse the last driver query
+_CONN_CACHE_MS = const(500)
+
+# Connection polling intervals
+_CONNECT_POLL_MIN_MS = const(10)   # First isconnected() poll (doubles each time)
+_CONNECT_POLL_MS = const(100)      # Poll interval cap while associating
+_RECONNECT_DELAY_MS = const(1000)  # Settle time after disconnect before reconnecting
+
+# Driver states that end a connection attempt without waiting for the timeout
+_TERMINAL_STATUSES = (
+    network.STAT_WRONG_PASSWORD,
+    network.STAT_NO_AP_FOUND,
+    network.STAT_CONNECT_FAIL
+)
+
+# Retry delay as shown in log messages (formatted once)
+_RETRY_DELAY_STR = "%.1f" % (WIFI_RETRY_DELAY_MS / 1000)
+
+# mDNS responder is only built into some MicroPython ports/versions
+_HAS_MDNS = hasattr(network, "mDNS")
 
 
 class WiFiManager:
@@ -34,6 +56,29 @@ class WiFiManager:
         self.ip = None
         self.connected = False
         self.rssi = 0
+        self._fail_reason = None  # Why the last _attempt_connect() failed
+        
+        # Connection state cache (refreshed at most every _CONN_CACHE_MS)
+        self._conn_cache_time = None
+        self._ifconfig = None
+        self._rssi_cache = None
+        
+        # Reused by get_status() so status polls don't allocate
+        self._status_connected = {
+            "connected": True,
+            "ip": None,
+            "subnet": None,
+            "gateway": None,
+            "dns": None,
+            "rssi": None,
+            "ssid": WIFI_SSID
+        }
+        self._status_disconnected = {
+            "connected": False,
+            "ip": None,
+            "rssi": None,
+            "ssid": WIFI_SSID
+        }
     
     async def connect(self, max_retries=3):
         """
@@ -51,6 +96,7 @@ class WiFiManager:
             debug_print(f"Attempting Wi-Fi connection (attempt {retry_count + 1}/{max_retries})...")
             
             if await self._attempt_connect():
+                self._invalidate_cache()
                 self.connected = True
                 self.ip = self.wlan.ifconfig()[0]
                 self.rssi = self._get_rssi()
@@ -64,8 +110,10 @@ class WiFiManager:
             
             retry_count += 1
             if retry_count < max_retries:
-                debug_print(f"Connection failed. Retrying in {WIFI_RETRY_DELAY_MS/1000}s...")
+                debug_print("Connection failed (" + self._fail_reason + "). Retrying in " + _RETRY_DELAY_STR + "s...")
                 await asyncio.sleep_ms(WIFI_RETRY_DELAY_MS)
+            else:
+                debug_print("Connection failed (" + self._fail_reason + ")")
         
         debug_print("Wi-Fi connection failed after all retries", force=True)
         return None
@@ -74,23 +122,34 @@ class WiFiManager:
         """
         Single connection attempt.
         
+        On failure the reason is left in self._fail_reason for the caller
+        to report.
+        
         Returns:
             True if connected, False otherwise
         """
         try:
             self.wlan.connect(WIFI_SSID, WIFI_PASSWORD)
             
+            # Poll quickly at first (warm reconnects can finish in a few ms),
+            # backing off to _CONNECT_POLL_MS for a slow association
+            wait_ms = _CONNECT_POLL_MIN_MS
             start_time = time.ticks_ms()
             while not self.wlan.isconnected():
-                if time_diff_ms(start_time, time.ticks_ms()) > WIFI_TIMEOUT_MS:
-                    debug_print("Connection timeout")
+                status = self.wlan.status()
+                if status in _TERMINAL_STATUSES:
+                    self._fail_reason = "status %d" % status
                     return False
-                await asyncio.sleep_ms(100)
+                if time.ticks_diff(time.ticks_ms(), start_time) > WIFI_TIMEOUT_MS:
+                    self._fail_reason = "timeout"
+                    return False
+                await asyncio.sleep_ms(wait_ms)
+                wait_ms = min(wait_ms * 2, _CONNECT_POLL_MS)
             
             return True
         
         except Exception as e:
-            debug_print(f"Connection error: {e}")
+            self._fail_reason = "error: %s" % e
             return False
     
     def _setup_mdns(self):
@@ -98,14 +157,15 @@ class WiFiManager:
         Setup mDNS responder for hostname-based discovery.
         Allows robot to be found as picogo1.local, picogo2.local, etc.
         """
+        if not _HAS_MDNS:
+            debug_print("mDNS not available on this MicroPython version", force=True)
+            return
+        
         try:
-            import network
             mdns = network.mDNS()
             mdns.start(MDNS_HOSTNAME, "MicroPython Robot")
             mdns.add_service('_robot', '_udp', 8765, txt='robot')
             debug_print(f"mDNS enabled: {MDNS_HOSTNAME}.local", force=True)
-        except ImportError:
-            debug_print("mDNS not available on this MicroPython version", force=True)
         except Exception as e:
             debug_print(f"mDNS setup error: {e}", force=True)
     
@@ -123,16 +183,54 @@ class WiFiManager:
         except:
             return -99
     
+    def _invalidate_cache(self):
+        """Force the next is_connected() call to query the driver."""
+        self._conn_cache_time = None
+        self._ifconfig = None
+        self._rssi_cache = None
+    
     def is_connected(self):
         """
         Check if Wi-Fi is currently connected.
         
+        The driver is queried at most once per _CONN_CACHE_MS; calls in
+        between return the cached state.
+        
         Returns:
             True if connected, False otherwise
         """
+        now = time.ticks_ms()
+        if self._conn_cache_time is not None and time.ticks_diff(now, self._conn_cache_time) < _CONN_CACHE_MS:
+            return self.connected
+        
         self.connected = self.wlan.isconnected()
+        self._conn_cache_time = now
+        self._ifconfig = None
+        self._rssi_cache = None
         return self.connected
     
+    def _get_ifconfig(self):
+        """
+        Get interface configuration, cached for the current cache window.
+        
+        Returns:
+            (ip, subnet, gateway, dns) tuple
+        """
+        if self._ifconfig is None:
+            self._ifconfig = self.wlan.ifconfig()
+        return self._ifconfig
+    
+    def _get_cached_rssi(self):
+        """
+        Get signal strength, cached for the current cache window.
+        
+        Returns:
+            RSSI in dBm
+        """
+        if self._rssi_cache is None:
+            self._rssi_cache = self._get_rssi()
+        return self._rssi_cache
+    
     def get_ip(self):
         """
         Get current IP address.
@@ -141,34 +239,30 @@ class WiFiManager:
             IP address string or None
         """
         if self.is_connected():
-            return self.wlan.ifconfig()[0]
+            return self._get_ifconfig()[0]
         return None
     
     def get_status(self):
         """
         Get comprehensive Wi-Fi status.
         
+        One of two preallocated dictionaries (connected/disconnected) is
+        returned; the connected one is updated in place on every call.
+        
         Returns:
             Dictionary with connection status
         """
         if self.is_connected():
-            ifconfig = self.wlan.ifconfig()
-            return {
-                "connected": True,
-                "ip": ifconfig[0],
-                "subnet": ifconfig[1],
-                "gateway": ifconfig[2],
-                "dns": ifconfig[3],
-                "rssi": self._get_rssi(),
-                "ssid": WIFI_SSID
-            }
+            ifconfig = self._get_ifconfig()
+            s = self._status_connected
+            s["ip"] = ifconfig[0]
+            s["subnet"] = ifconfig[1]
+            s["gateway"] = ifconfig[2]
+            s["dns"] = ifconfig[3]
+            s["rssi"] = self._get_cached_rssi()
+            return s
         else:
-            return {
-                "connected": False,
-                "ip": None,
-                "rssi": None,
-                "ssid": WIFI_SSID
-            }
+            return self._status_disconnected
     
     async def reconnect(self):
         """
@@ -179,7 +273,8 @@ class WiFiManager:
         """
         debug_print("Attempting to reconnect Wi-Fi...")
         self.wlan.disconnect()
-        await asyncio.sleep_ms(1000)
+        self._invalidate_cache()
+        await asyncio.sleep_ms(_RECONNECT_DELAY_MS)
         return await self.connect(max_retries=3)
     
     def disconnect(self):
@@ -187,6 +282,7 @@ class WiFiManager:
         debug_print("Disconnecting Wi-Fi...")
         self.wlan.disconnect()
         self.wlan.active(False)
+        self._invalidate_cache()
         self.connected = False
         self.ip = None
 
@@ -12,11 +12,78 @@ Install via: mpremote mip install uwebsocket
 """
 
 import json
-import uasyncio as asyncio
+import micropython
+import socket
+import struct
 import time
-from config import WEBSOCKET_PORT, WEBSOCKET_HOST, STATE_CLIENT_OK, STATE_DRIVING, STATE_LINK_LOST
+import uasyncio as asyncio
+from micropython import const
+from config import DEBUG_MODE, WEBSOCKET_PORT, WEBSOCKET_HOST, WATCHDOG_TIMEOUT_MS, STATE_CLIENT_OK, STATE_DRIVING, STATE_LINK_LOST
 from utils import debug_print
 import calibration
+import config  # Module reference: set_profile updates its values at runtime
+
+# Exercise the json encoder and decoder once at import, so the first
+# client packet doesn't pay their cold-start cost
+try:
+    json.dumps(None)
+    json.loads("null")
+except Exception:
+    pass
+
+# Bound once so the drive path skips the module attribute lookup
+_json_loads = json.loads
+_ticks_ms = time.ticks_ms
+_ticks_diff = time.ticks_diff
+_ticks_add = time.ticks_add
+
+# Minimum interval between LCD updates from drive commands (~10 Hz)
+_UI_INTERVAL_MS = const(100)
+
+# Sender timestamps are reduced to the ticks_ms() period (2**30 on the Pico)
+_TICKS_MASK = const(0x3FFFFFFF)
+
+# Sender clock tracking (see _SenderClock). A run of stale commands whose
+# ages all stay within _JUMP_TOLERANCE_MS of each other for _RESYNC_MS is
+# taken as the sender's clock having stepped backwards and is re-synced;
+# anything less consistent is real delay and stays rejected. Clock drift
+# is followed by at most 1 ms per _CREEP_INTERVAL_MS.
+_RESYNC_MS = const(2000)
+_JUMP_TOLERANCE_MS = const(20)
+_CREEP_INTERVAL_MS = const(1000)
+
+# UDP drive commands up to this many seqs behind the newest one are
+# duplicates or reordered and are dropped; a larger step back means the
+# controller restarted its count. The window starts afresh for a new
+# sender or after WATCHDOG_TIMEOUT_MS without an accepted drive, since
+# controllers restart their seq at 0 on every launch.
+_SEQ_WINDOW = const(64)
+
+# Maximum sender-timestamp age of a drive command, per transport
+_UDP_MAX_AGE_MS = const(500)
+_TCP_MAX_AGE_MS = const(200)
+_WS_MAX_AGE_MS = const(500)
+
+# Socket options, None where the port doesn't provide them (MicroPython
+# only defines the constants its socket layer accepts)
+_IPPROTO_TCP = getattr(socket, "IPPROTO_TCP", None)
+_TCP_NODELAY = getattr(socket, "TCP_NODELAY", None) if _IPPROTO_TCP is not None else None
+_SOL_SOCKET = getattr(socket, "SOL_SOCKET", None)
+_SO_RCVBUF = getattr(socket, "SO_RCVBUF", None) if _SOL_SOCKET is not None else None
+_SO_SNDBUF = getattr(socket, "SO_SNDBUF", None) if _SOL_SOCKET is not None else None
+
+# Socket buffer sizes, applied where SO_RCVBUF/SO_SNDBUF are available
+_TCP_BUF_SIZE = const(4096)
+_UDP_RCVBUF_SIZE = const(8192)  # Room for a burst of drive packets
+
+# Drive commands between "Drive cmd" debug lines in udp_server
+_DEBUG_EVERY = const(30)
+
+# Largest UDP datagram read (larger ones are truncated)
+_UDP_RX_SIZE = const(1024)
+
+# Receive buffer for the WebSocket client connection (one JSON message per line)
+_RX_BUF_SIZE = const(1024)
 
 # ============================================================================
 # Event System (merged from events.py)
@@ -59,6 +126,9 @@ def get_event_bus():
 EVENT_CLIENT_CONNECTED = "client_connected"
 EVENT_CLIENT_DISCONNECTED = "client_disconnected"
 
+# Fixed-shape ACK sent for every WebSocket packet; only the values change
+_ACK_TMPL = '{"seq_ack":%d,"state":"%s","motor_enabled":%s,"packets_received":%d}\n'
+
 
 class WebSocketServer:
     """
@@ -77,13 +147,24 @@ class WebSocketServer:
         """
         self.motor_controller = motor_controller
         self.safety_controller = safety_controller
+        self._feed_watchdog = safety_controller.watchdog.feed  # Bound once for the packet path
         self.lcd_display = lcd_display
         self.underglow = underglow
         self.server = None
         self.client = None
+        self._client_write = None  # Bound writer.write of the connected client
+        self._client_drain = None  # Bound writer.drain of the connected client
         self.running = False
         self.packets_received = 0
         self.last_seq = 0
+        self._sender_clock = _SenderClock()
+        
+        # Command handlers, looked up once per packet
+        self._dispatch = {
+            "drive": self._handle_drive_command,
+            "stop": self._handle_stop_command,
+            "ping": self._handle_ping_command
+        }
         
         debug_print("WebSocket server initialized")
     
@@ -96,6 +177,8 @@ class WebSocketServer:
             # This is a simplified version - actual implementation will use uwebsocket
             asyncio.create_task(self._accept_connections())
             
+            _start_ui_worker(self.lcd_display)
+            
             self.running = True
             debug_print("WebSocket server started", force=True)
             
@@ -124,20 +207,29 @@ class WebSocketServer:
         try:
             debug_print("Client connected", force=True)
             self.client = (reader, writer)
+            self._client_write = writer.write
+            self._client_drain = writer.drain
             
             if self.lcd_display:
                 self.lcd_display.set_state(STATE_CLIENT_OK)
             
+            # Per-connection receive buffer; messages are handed to
+            # _process_message as memoryview slices, not copied out
+            framer = _LineFramer()
+            
             # Read loop
             while self.running:
                 try:
                     # Read message (simplified - actual WebSocket framing needed)
-                    data = await reader.read(1024)
-                    if not data:
+                    if not await framer.read(reader):
                         break
                     
-                    # Process message
-                    await self._process_message(data.decode())
+                    # Process each complete line in place
+                    while True:
+                        line = framer.next_line()
+                        if line is None:
+                            break
+                        await self._process_message(line)
                     
                 except Exception as e:
                     debug_print(f"Error reading message: {e}")
@@ -149,6 +241,8 @@ class WebSocketServer:
         finally:
             debug_print("Client disconnected", force=True)
             self.client = None
+            self._client_write = None
+            self._client_drain = None
             if writer:
                 writer.close()
                 await writer.wait_closed()
@@ -158,26 +252,26 @@ class WebSocketServer:
         Process received WebSocket message.
         
         Args:
-            message: JSON message string
+            message: JSON message (str or bytes-like, e.g. a memoryview
+                slice of the receive buffer)
         """
         try:
             # Parse JSON
-            packet = json.loads(message)
+            packet = _json_loads(message)
             
             # Validate packet
             if not self._validate_packet(packet):
                 debug_print("Invalid packet received")
                 return
             
-            # Extract command
+            # Extract command and dispatch; handlers report whether the
+            # packet counts as link activity, and the watchdog is fed once here
             cmd = packet.get("cmd")
+            handler = self._dispatch.get(cmd)
             
-            if cmd == "drive":
-                await self._handle_drive_command(packet)
-            elif cmd == "stop":
-                await self._handle_stop_command(packet)
-            elif cmd == "ping":
-                await self._handle_ping_command(packet)
+            if handler:
+                if await handler(packet):
+                    self._feed_watchdog()
             else:
                 debug_print(f"Unknown command: {cmd}")
             
@@ -199,8 +293,7 @@ class WebSocketServer:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = ["cmd", "seq"]
-        return all(field in packet for field in required_fields)
+        return "cmd" in packet and "seq" in packet
     
     async def _handle_drive_command(self, packet):
         """
@@ -208,28 +301,23 @@ class WebSocketServer:
         
         Args:
             packet: Drive command packet
+        
+        Returns:
+            True if the command was applied (feeds the watchdog)
         """
         try:
-            # Check timestamp to reject stale commands (max age: 500ms)
+            # Check timestamp to reject stale commands
             timestamp = packet.get("ts", 0)
-            if timestamp > 0:
-                import time
-                current_time = int(time.time() * 1000)  # Current time in milliseconds
-                age_ms = current_time - timestamp
-                
-                if age_ms > 500:  # Reject commands older than 500ms
-                    debug_print(f"Stale command rejected (age: {age_ms}ms)")
-                    return
-                elif age_ms < -1000:  # Clock skew detected
-                    debug_print(f"Clock skew detected: {age_ms}ms")
-                    # Continue anyway, but warn
-            
-            axes = packet.get("axes", {})
-            throttle = axes.get("throttle", 0.0)
-            steer = axes.get("steer", 0.0)
+            if timestamp > 0 and not self._sender_clock.accept(timestamp, _WS_MAX_AGE_MS):
+                return False
             
-            # Feed watchdog
-            self.safety_controller.feed_watchdog()
+            # Plain indexing; a packet missing any axis drives nothing
+            try:
+                axes = packet["axes"]
+                throttle = axes["throttle"]
+                steer = axes["steer"]
+            except KeyError:
+                throttle = steer = 0.0
             
             # Update motor control
             if not self.motor_controller.enabled:
@@ -237,15 +325,16 @@ class WebSocketServer:
             
             self.motor_controller.drive(throttle, steer)
             
-            # Update display
-            if self.lcd_display:
-                self.lcd_display.set_state(STATE_DRIVING, throttle=throttle, steer=steer)
+            # Display update is left to _ui_worker
+            _post_drive_ui(throttle, steer)
             
             self.packets_received += 1
             self.last_seq = packet.get("seq", 0)
+            return True
             
         except Exception as e:
             debug_print(f"Drive command error: {e}")
+            return False
     
     async def _handle_stop_command(self, packet):
         """
@@ -253,10 +342,13 @@ class WebSocketServer:
         
         Args:
             packet: Stop command packet
+        
+        Returns:
+            True (feeds the watchdog)
         """
         debug_print("Stop command received")
         self.motor_controller.stop()
-        self.safety_controller.feed_watchdog()
+        return True
     
     async def _handle_ping_command(self, packet):
         """
@@ -264,9 +356,12 @@ class WebSocketServer:
         
         Args:
             packet: Ping command packet
+        
+        Returns:
+            True (feeds the watchdog)
         """
-        # Just send acknowledgment
-        self.safety_controller.feed_watchdog()
+        # Nothing to do beyond keeping the link alive and sending the ACK
+        return True
     
     async def _send_ack(self, packet):
         """
@@ -275,28 +370,25 @@ class WebSocketServer:
         Args:
             packet: Original packet to acknowledge
         """
-        if not self.client:
+        write = self._client_write
+        if not write:
             return
         
         try:
-            reader, writer = self.client
-            
-            # Get current status
-            motor_status = self.motor_controller.get_status()
-            safety_status = self.safety_controller.get_status()
-            
-            # Build response
-            response = {
-                "seq_ack": packet.get("seq", 0),
-                "state": "DRIVING" if not safety_status["watchdog"]["timed_out"] else "LINK_LOST",
-                "motor_enabled": motor_status["enabled"],
-                "packets_received": self.packets_received
-            }
+            # Read the two flags directly rather than building status dicts
+            state = "LINK_LOST" if self.safety_controller.watchdog.timed_out else "DRIVING"
+            enabled = "true" if self.motor_controller.enabled else "false"
             
             # Send response (simplified - actual WebSocket framing needed)
-            message = json.dumps(response) + "\n"
-            writer.write(message.encode())
-            await writer.drain()
+            message = _ACK_TMPL % (packet.get("seq", 0), state, enabled, self.packets_received)
+            write(message.encode())
+            
+            # Stream.write() sends straight to the socket when nothing is
+            # queued; only await drain() if part of the ACK is still pending
+            # (older uasyncio versions queue everything, so this still
+            # drains there)
+            if self.client[1].out_buf:
+                await self._client_drain()
             
         except Exception as e:
             debug_print(f"Error sending ACK: {e}")
@@ -326,66 +418,695 @@ class WebSocketServer:
 
 
 # ============================================================================
-# PACKET HANDLING (Consolidated)
+# DRIVE PACKET FAST PARSER
 # ============================================================================
+# Drive packets arrive at up to ~100 Hz and only a handful of fields are
+# used, so they are scanned directly from the received bytes instead of
+# building a dict tree with json.loads. Other (rare) commands still go
+# through json.loads.
+#
+# The byte scanning is pure integer work and is compiled with
+# @micropython.viper (buffers are read through ptr8). Viper has no floats,
+# so the axis values are parsed by a @micropython.native function.
 
-def _process_drive_command(packet, motor_controller, safety_controller, lcd_display, underglow=None, packet_count=0, max_age_ms=500):
+# Command ids returned by _parse_cmd_id() / _parse_drive()
+_CMD_OTHER = const(0)
+_CMD_DRIVE = const(1)
+
+_KEY_CMD = b'"cmd"'
+_KEY_SEQ = b'"seq"'
+_KEY_TS = b'"ts"'
+_KEY_THROTTLE = b'"throttle"'
+_KEY_STEER = b'"steer"'
+_VALUE_DRIVE = b'"drive"'
+
+# Lengths of the strings above (constants so viper code can use them)
+_KEY_CMD_LEN = const(5)
+_KEY_SEQ_LEN = const(5)
+_KEY_TS_LEN = const(4)
+_KEY_THROTTLE_LEN = const(10)
+_KEY_STEER_LEN = const(7)
+_VALUE_DRIVE_LEN = const(7)
+
+
+@micropython.viper
+def _find_value(buf: ptr8, n: int, key: ptr8, klen: int) -> int:
     """
-    Process drive command packet (consolidated handler).
+    Find where the value for a JSON key starts.
     
     Args:
-        packet: Parsed JSON packet
-        motor_controller: Motor controller instance
-        safety_controller: Safety controller instance
-        lcd_display: LCD display instance
-        underglow: Underglow LED controller (optional)
-        packet_count: Current packet count for debugging
-        max_age_ms: Maximum age for command timestamp (500ms for UDP, 200ms for TCP)
+        buf: Raw packet bytes
+        n: Length of buf
+        key: Quoted key to look for (e.g. b'"seq"')
+        klen: Length of key
     
     Returns:
-        True if command was processed, False if rejected
+        Index of the first value byte, or -1 if the key is absent
     """
-    # Check timestamp to reject stale commands
-    timestamp = packet.get("ts", 0)
+    last = n - klen
+    i = 0
+    while i <= last:
+        j = 0
+        while j < klen and buf[i + j] == key[j]:
+            j += 1
+        if j == klen:
+            i += klen
+            # Skip the ':' separator and any whitespace around it
+            while i < n:
+                c = int(buf[i])
+                if c != 58 and c != 32 and c != 9:  # ':', ' ', '\t'
+                    break
+                i += 1
+            return i
+        i += 1
+    return -1
+
+
+@micropython.viper
+def _find_byte(buf: ptr8, start: int, end: int, c: int) -> int:
+    """
+    Find the first occurrence of a byte value in buf[start:end].
+    
+    Works on bytearray/memoryview, which lack find() in MicroPython.
+    
+    Args:
+        buf: Buffer to search
+        start: First index to search
+        end: Index to stop at (exclusive)
+        c: Byte value to look for
+    
+    Returns:
+        Index of the byte, or -1 if not found
+    """
+    i = start
+    while i < end:
+        if int(buf[i]) == c:
+            return i
+        i += 1
+    return -1
+
+
+@micropython.viper
+def _parse_cmd_id(buf, n: int) -> int:
+    """
+    Identify the command of a raw JSON packet.
+    
+    Args:
+        buf: Raw packet bytes
+        n: Length of buf
+    
+    Returns:
+        _CMD_DRIVE for drive commands, _CMD_OTHER for anything else
+    """
+    i = int(_find_value(buf, n, _KEY_CMD, _KEY_CMD_LEN))
+    if i < 0 or i + _VALUE_DRIVE_LEN > n:
+        return _CMD_OTHER
+    p = ptr8(buf)
+    drive = ptr8(_VALUE_DRIVE)
+    j = 0
+    while j < _VALUE_DRIVE_LEN:
+        if p[i + j] != drive[j]:
+            return _CMD_OTHER
+        j += 1
+    return _CMD_DRIVE
+
+
+@micropython.viper
+def _parse_int_field(buf, n: int, key, klen: int) -> int:
+    """
+    Parse a small non-negative JSON integer field (e.g. seq).
+    
+    The value is accumulated in a machine word, so it must fit in 31 bits.
+    
+    Args:
+        buf: Raw packet bytes
+        n: Length of buf
+        key: Quoted key to look for
+        klen: Length of key
+    
+    Returns:
+        Parsed integer, or -1 if the key is absent
+    """
+    i = int(_find_value(buf, n, key, klen))
+    if i < 0:
+        return -1
+    p = ptr8(buf)
+    val = 0
+    while i < n:
+        d = int(p[i]) - 48
+        if d < 0 or d > 9:
+            break
+        val = val * 10 + d
+        i += 1
+    return val
+
+
+@micropython.native
+def _parse_int(buf, i):
+    """
+    Parse a JSON integer of any size starting at index i.
+    
+    Args:
+        buf: Raw packet bytes
+        i: Index of the first character of the number
+    
+    Returns:
+        Parsed integer
+    """
+    n = len(buf)
+    neg = i < n and buf[i] == 45  # '-'
+    if neg:
+        i += 1
+    val = 0
+    while i < n:
+        d = buf[i] - 48
+        if d < 0 or d > 9:
+            break
+        val = val * 10 + d
+        i += 1
+    return -val if neg else val
+
+
+@micropython.native
+def _parse_float_field(buf, n, key, klen):
+    """
+    Parse a JSON number field (integer, fraction and optional exponent).
+    
+    Args:
+        buf: Raw packet bytes
+        n: Length of buf
+        key: Quoted key to look for
+        klen: Length of key
+    
+    Returns:
+        Parsed float, or None if the key is absent
+    """
+    i = _find_value(buf, n, key, klen)
+    if i < 0:
+        return None
+    
+    neg = i < n and buf[i] == 45  # '-'
+    if neg:
+        i += 1
+    
+    # Accumulate all digits as one integer, remembering the decimal scale
+    mant = 0
+    while i < n:
+        d = buf[i] - 48
+        if d < 0 or d > 9:
+            break
+        mant = mant * 10 + d
+        i += 1
+    scale = 1
+    if i < n and buf[i] == 46:  # '.'
+        i += 1
+        while i < n:
+            d = buf[i] - 48
+            if d < 0 or d > 9:
+                break
+            mant = mant * 10 + d
+            scale *= 10
+            i += 1
+    val = mant / scale
+    
+    # json.dumps writes very small values as e.g. 1e-05
+    if i < n and (buf[i] == 101 or buf[i] == 69):  # 'e', 'E'
+        i += 1
+        if i < n and buf[i] == 43:  # '+'
+            i += 1
+        val *= 10.0 ** _parse_int(buf, i)
+    
+    return -val if neg else val
+
+
+def _parse_drive(buf):
+    """
+    Extract the drive fields from a raw JSON packet without json.loads.
+    
+    Args:
+        buf: Raw packet bytes
+    
+    Returns:
+        (cmd_id, seq, ts, throttle, steer) tuple. cmd_id is _CMD_OTHER when
+        the packet is not a drive command with a seq field; such packets
+        should be decoded with json.loads instead.
+    """
+    n = len(buf)
+    if _parse_cmd_id(buf, n) != _CMD_DRIVE:
+        return _CMD_OTHER, 0, 0, 0.0, 0.0
+    
+    seq = _parse_int_field(buf, n, _KEY_SEQ, _KEY_SEQ_LEN)
+    if seq < 0:
+        return _CMD_OTHER, 0, 0, 0.0, 0.0
+    
+    # ts is a wall-clock millisecond count and needs more than a machine word
+    i = _find_value(buf, n, _KEY_TS, _KEY_TS_LEN)
+    ts = _parse_int(buf, i) if i >= 0 else 0
+    
+    throttle = _parse_float_field(buf, n, _KEY_THROTTLE, _KEY_THROTTLE_LEN)
+    steer = _parse_float_field(buf, n, _KEY_STEER, _KEY_STEER_LEN)
+    
+    # Same rule as the json.loads paths: a packet missing any axis drives
+    # nothing
+    if throttle is None or steer is None:
+        return _CMD_DRIVE, seq, ts, 0.0, 0.0
+    return _CMD_DRIVE, seq, ts, throttle, steer
+
+
+# ----------------------------------------------------------------------------
+# Binary (MessagePack) drive packets - UDP only
+# ----------------------------------------------------------------------------
+# A datagram starting with _PROTO_MSGPACK instead of '{' carries a
+# MessagePack array [cmd_id, seq, ts, throttle, steer]. All five are
+# integers; throttle and steer are scaled to -127..127. Only _CMD_DRIVE
+# is defined. Responses stay JSON.
+
+_PROTO_MSGPACK = const(0x01)
+_MSGPACK_FIXARRAY_5 = const(0x95)
+
+# Decoded array items, reused for every packet
+_mp_vals = [0, 0, 0, 0, 0]
+
+
+@micropython.native
+def _parse_msgpack_drive(buf):
+    """
+    Extract the drive fields from a binary (MessagePack) packet.
+    
+    Only the integer encodings are accepted (fixint, uint8-64, int8-64),
+    which is all this packet shape uses.
+    
+    Args:
+        buf: Raw packet bytes, starting with _PROTO_MSGPACK
+    
+    Returns:
+        (cmd_id, seq, ts, throttle, steer) tuple, same as _parse_drive().
+        cmd_id is _CMD_OTHER for malformed or non-drive packets.
+    """
+    n = len(buf)
+    if n < 7 or buf[1] != _MSGPACK_FIXARRAY_5:
+        return _CMD_OTHER, 0, 0, 0.0, 0.0
+    
+    vals = _mp_vals
+    i = 2
+    k = 0
+    while k < 5:
+        if i >= n:
+            return _CMD_OTHER, 0, 0, 0.0, 0.0
+        b = buf[i]
+        i += 1
+        if b < 0x80:  # positive fixint
+            v = b
+        elif b >= 0xE0:  # negative fixint
+            v = b - 256
+        elif 0xCC <= b <= 0xD3:  # uint8..uint64 (0xCC-0xCF), int8..int64 (0xD0-0xD3)
+            size = 1 << ((b - 0xCC) & 3)
+            if i + size > n:
+                return _CMD_OTHER, 0, 0, 0.0, 0.0
+            v = 0
+            for j in range(size):
+                v = (v << 8) | buf[i + j]
+            if b >= 0xD0 and buf[i] >= 0x80:
+                v -= 1 << (size * 8)
+            i += size
+        else:
+            return _CMD_OTHER, 0, 0, 0.0, 0.0
+        vals[k] = v
+        k += 1
+    
+    if vals[0] != _CMD_DRIVE:
+        return _CMD_OTHER, 0, 0, 0.0, 0.0
+    return _CMD_DRIVE, vals[1], vals[2], vals[3] / 127, vals[4] / 127
+
+
+# A datagram starting with _PROTO_FIXED has a fixed little-endian layout
+# instead: magic (0xD1), seq (uint32), ts (uint32, milliseconds), throttle
+# and steer (int8, scaled x100). No type tags, so one unpack_from() call
+# decodes it. Drive only, like the MessagePack form.
+
+_PROTO_FIXED = const(0xD1)
+_FIXED_DRIVE_FMT = "<BIIbb"
+_FIXED_DRIVE_SIZE = const(11)
+
+
+def _parse_fixed_drive(buf):
+    """
+    Extract the drive fields from a fixed-layout binary packet.
+    
+    Args:
+        buf: Raw packet bytes, starting with _PROTO_FIXED
+    
+    Returns:
+        (cmd_id, seq, ts, throttle, steer) tuple, same as _parse_drive().
+        cmd_id is _CMD_OTHER if the packet has the wrong length.
+    """
+    if len(buf) != _FIXED_DRIVE_SIZE:
+        return _CMD_OTHER, 0, 0, 0.0, 0.0
+    _, seq, ts, throttle, steer = struct.unpack_from(_FIXED_DRIVE_FMT, buf, 0)
+    return _CMD_DRIVE, seq, ts, throttle / 100, steer / 100
+
+
+# ============================================================================
+# PACKET HANDLING (Consolidated)
+# ============================================================================
+
+class _LineFramer:
+    """
+    Newline framing over one fixed, per-connection receive buffer.
+    
+    Lines are handed out as memoryview slices of the buffer, valid until
+    the next read(). A partial line is slid to the front only when the
+    buffer fills; a line longer than the whole buffer is dropped up to
+    and including its newline.
+    """
+    
+    def __init__(self, size=_RX_BUF_SIZE):
+        """
+        Initialize line framer.
+        
+        Args:
+            size: Receive buffer size (longest accepted line)
+        """
+        self.buf = bytearray(size)
+        self.mv = memoryview(self.buf)
+        self.size = size
+        self.start = 0  # First unprocessed byte
+        self.end = 0    # End of received data
+        self.discard = False  # Skipping the rest of an overlong line
+    
+    async def read(self, reader):
+        """
+        Read more data from the stream into the buffer.
+        
+        Args:
+            reader: Stream reader (needs readinto())
+        
+        Returns:
+            False once the stream is closed, True otherwise
+        """
+        # Make room: slide a partial line to the front, or drop it if it
+        # alone fills the buffer
+        if self.end == self.size:
+            start = self.start
+            if start == 0:
+                debug_print("Line too long, dropped")
+                self.end = 0
+                self.discard = True
+            else:
+                self.buf[:self.end - start] = bytes(self.mv[start:self.end])
+                self.end -= start
+                self.start = 0
+        
+        n = await reader.readinto(self.mv[self.end:])
+        if not n:
+            return False
+        self.end += n
+        return True
+    
+    def next_line(self):
+        """
+        Get the next complete line received so far.
+        
+        Returns:
+            Line without its newline as a memoryview slice, or None when
+            no complete line is left (empty lines are skipped)
+        """
+        buf = self.buf
+        start = self.start
+        end = self.end
+        while True:
+            nl = _find_byte(buf, start, end, 10)  # '\n'
+            if nl < 0:
+                if start == end:
+                    start = end = 0  # Everything consumed, rewind
+                    self.end = 0
+                self.start = start
+                return None
+            if self.discard:
+                self.discard = False  # Tail of an overlong line
+            elif nl > start:
+                self.start = nl + 1
+                return self.mv[start:nl]
+            start = nl + 1  # Empty or discarded line
+
+
+class _SenderClock:
+    """
+    Staleness check for sender timestamps, using ticks_ms().
     
-    if timestamp > 0:
-        current_time = int(time.time() * 1000)
-        age_ms = current_time - timestamp
+    The controller stamps packets with its wall clock, whose epoch differs
+    from the Pico's. The first packet fixes an offset between the two
+    clocks; later packets are aged against it, so an age is the extra
+    delay compared to the fastest packet seen so far.
+    """
+    
+    def __init__(self):
+        """Initialize with no offset (set by the first packet)."""
+        self.offset = None
+        self.creep_ms = 0      # When the offset last crept (ticks_ms)
+        self.stale_since = None  # When the current stale run began, or None
+        self.stale_age = 0     # Age of the first command in that run
+    
+    def accept(self, timestamp, max_age_ms):
+        """
+        Check whether a command is fresh enough to apply.
+        
+        Args:
+            timestamp: Sender timestamp in milliseconds (any epoch)
+            max_age_ms: Maximum accepted age in milliseconds
+        
+        Returns:
+            True if the command should be applied, False if it is stale
+        """
+        now = _ticks_ms()
+        ts = timestamp & _TICKS_MASK
+        
+        if self.offset is None:
+            self.offset = _ticks_diff(now, ts)
+            self.creep_ms = now
+            return True
+        
+        age_ms = _ticks_diff(now, _ticks_add(ts, self.offset))
         
         if age_ms > max_age_ms:
+            if self.stale_since is None or abs(age_ms - self.stale_age) > _JUMP_TOLERANCE_MS:
+                # Start of a (new) stale run
+                self.stale_since = now
+                self.stale_age = age_ms
+            elif _ticks_diff(now, self.stale_since) >= _RESYNC_MS:
+                # Steady offset for the whole run: the sender clock was
+                # stepped back. Re-sync, but judge only later commands by it.
+                debug_print(f"Sender clock re-synced (step: {age_ms}ms)")
+                self.offset = _ticks_diff(now, ts)
+                self.creep_ms = now
+                self.stale_since = None
+                return False
             debug_print(f"Stale command rejected (age: {age_ms}ms)")
             return False
-        elif age_ms < -1000:  # Clock skew detected
-            debug_print(f"Clock skew detected: {age_ms}ms")
+        
+        self.stale_since = None
+        if age_ms < 0:
+            # Faster than any packet so far (or the sender clock jumped
+            # ahead): re-sync on this packet
+            self.offset = _ticks_diff(now, ts)
+        elif age_ms > 0 and _ticks_diff(now, self.creep_ms) >= _CREEP_INTERVAL_MS:
+            # Creep towards the current delay, slowly enough to follow only
+            # the drift between the two crystals
+            self.offset += 1
+            self.creep_ms = now
+        return True
+
+
+# Drive handlers only record the latest axes; _ui_worker pushes them to the
+# LCD at most every _UI_INTERVAL_MS, so display I/O never runs between a
+# packet arriving and the motors responding. The slot is overwritten rather
+# than queued - an older display state is worthless.
+_ui_drive = [0.0, 0.0]  # Latest (throttle, steer) for the display
+_ui_event = asyncio.Event()
+_ui_task = None
+
+
+def _post_drive_ui(throttle, steer):
+    """
+    Hand the latest drive axes to the display worker.
     
-    axes = packet.get("axes", {})
-    throttle = axes.get("throttle", 0.0)
-    steer = axes.get("steer", 0.0)
+    Args:
+        throttle: Throttle axis value
+        steer: Steering axis value
+    """
+    _ui_drive[0] = throttle
+    _ui_drive[1] = steer
+    _ui_event.set()
+
+
+async def _ui_worker(lcd_display):
+    """
+    Apply posted drive axes to the LCD, at most every _UI_INTERVAL_MS.
     
-    # DEBUG: Print every 30th packet
-    if packet_count > 0 and packet_count % 30 == 0:
-        debug_print(f"Drive cmd: T={throttle:.2f} S={steer:.2f} PKT={packet_count}")
+    Args:
+        lcd_display: LCD display instance
+    """
+    while True:
+        await _ui_event.wait()
+        _ui_event.clear()
+        try:
+            lcd_display.set_driving(_ui_drive[0], _ui_drive[1])
+        except Exception as e:
+            debug_print(f"Display update error: {e}")
+        await asyncio.sleep_ms(_UI_INTERVAL_MS)
+
+
+def _start_ui_worker(lcd_display):
+    """
+    Start the display worker once, shared by all servers.
+    
+    Args:
+        lcd_display: LCD display instance (nothing is started if None)
+    """
+    global _ui_task
+    if lcd_display and _ui_task is None:
+        _ui_task = asyncio.create_task(_ui_worker(lcd_display))
+
+
+def _process_drive_command(packet, motor_drive, feed_watchdog, clock, max_age_ms):
+    """
+    Process drive command packet (consolidated handler).
+    
+    Args:
+        packet: Parsed JSON packet
+        motor_drive: Drive function (the bound MotorController.drive)
+        feed_watchdog: Watchdog feed function (the bound Watchdog.feed)
+        clock: _SenderClock of the connection, for the staleness check
+        max_age_ms: Maximum age for command timestamp (_UDP_MAX_AGE_MS or _TCP_MAX_AGE_MS)
+    
+    Returns:
+        True if command was processed, False if rejected
+    """
+    # Plain indexing; a packet missing any axis drives nothing
+    try:
+        axes = packet["axes"]
+        throttle = axes["throttle"]
+        steer = axes["steer"]
+    except KeyError:
+        throttle = steer = 0.0
+    return _process_drive_fast(
+        packet.get("ts", 0), throttle, steer,
+        motor_drive, feed_watchdog, clock, max_age_ms
+    )
+
+
+def _process_drive_fast(timestamp, throttle, steer, motor_drive, feed_watchdog, clock, max_age_ms):
+    """
+    Process drive command from already-extracted fields.
+    
+    Motors must already be enabled (see _enable_motors); the server loops
+    latch that once per client instead of checking on every packet. All
+    arguments are positional, and the callables are bound once per
+    client, so a call does no keyword or attribute lookups.
+    
+    Args:
+        timestamp: Sender timestamp in milliseconds (0 if absent)
+        throttle: Throttle axis value
+        steer: Steering axis value
+        motor_drive: Drive function (the bound MotorController.drive)
+        feed_watchdog: Watchdog feed function (the bound Watchdog.feed)
+        clock: _SenderClock of the connection, for the staleness check
+        max_age_ms: Maximum age for command timestamp (_UDP_MAX_AGE_MS or _TCP_MAX_AGE_MS)
+    
+    Returns:
+        True if command was processed, False if rejected
+    """
+    # Check timestamp to reject stale commands
+    if timestamp > 0 and not clock.accept(timestamp, max_age_ms):
+        return False
     
     # Feed watchdog FIRST (critical for safety)
-    safety_controller.feed_watchdog()
+    feed_watchdog()
+    
+    # Execute drive command
+    motor_drive(throttle, steer)
+    
+    # Display update is left to _ui_worker
+    _post_drive_ui(throttle, steer)
     
-    # Enable motors if needed
+    return True
+
+
+def _enable_motors(motor_controller, underglow=None):
+    """
+    Enable motors ahead of a client's first drive command.
+    
+    Args:
+        motor_controller: Motor controller instance
+        underglow: Underglow LED controller (optional)
+    """
     if not motor_controller.enabled:
         motor_controller.enable()
         debug_print("Motors enabled", force=True)
     
-    # Execute drive command
-    motor_controller.drive(throttle, steer)
+    # Switch underglow to DRIVING state on the first drive command
+    if underglow:
+        underglow.set_state(STATE_DRIVING)
+
+
+# Robot identity never changes at runtime, so it is read from config once
+_ROBOT_ID = config.ROBOT_ID
+_MDNS_HOSTNAME = config.MDNS_HOSTNAME
+
+# Bumped by set_profile (which changes config.ROBOT_COLOR/ROBOT_NAME)
+_profile_version = 0
+
+# Encoded discovery reply. It is rebuilt after a profile change (new
+# _profile_version) or a calibration change (new cal.to_json() string).
+_discovery_response = None
+_discovery_cal_json = None
+_discovery_profile_version = -1
+
+# Fixed-shape calibration reply; only seq_ack and the calibration change
+_CAL_RESPONSE_TMPL = '{"type":"calibration_response","seq_ack":%d,"calibration":%s}\n'
+
+
+# Fixed set_profile replies
+_PROFILE_MISSING_RESPONSE = b'{"type":"profile_response","success":false,"message":"Missing robot_id or name"}\n'
+_PROFILE_OK_TMPL = ('{"type":"profile_response","success":true,'
+                    '"message":"Profile updated: %s RGB[%d, %d, %d]",'
+                    '"robot_id":%d,"name":"%s","color":[%d,%d,%d]}\n')
+
+
+def _send_json(sock, addr, obj):
+    """
+    Send an object as one newline-terminated JSON datagram.
     
-    # Update LCD (throttled internally)
-    if lcd_display:
-        lcd_display.set_state(STATE_DRIVING, throttle=throttle, steer=steer)
+    MicroPython sockets accept str directly, so no encode() copy is made.
     
-    # Update underglow to DRIVING state (track if first drive command)
-    if underglow and packet_count == 1:
-        underglow.set_state(STATE_DRIVING)
+    Args:
+        sock: UDP socket
+        addr: Destination address tuple
+        obj: JSON-serializable object
+    """
+    sock.sendto(json.dumps(obj) + "\n", addr)
+
+
+def _get_discovery_response():
+    """
+    Get the encoded robot_info reply for discovery requests.
     
-    return True
+    Returns:
+        Response bytes (built on first use and cached)
+    """
+    global _discovery_response, _discovery_cal_json, _discovery_profile_version
+    cal_json = calibration.get_calibration().to_json()
+    if cal_json is not _discovery_cal_json or _profile_version != _discovery_profile_version:
+        _discovery_response = (json.dumps({
+            "type": "robot_info",
+            "robot_id": _ROBOT_ID,
+            "hostname": _MDNS_HOSTNAME,
+            "version": "1.0",
+            "color": list(config.ROBOT_COLOR)  # RGB tuple as list
+        })[:-1] + ', "calibration": ' + cal_json + "}\n").encode()
+        _discovery_cal_json = cal_json
+        _discovery_profile_version = _profile_version
+    return _discovery_response
 
 
 def _process_get_calibration_command(packet, sock, addr):
@@ -399,14 +1120,7 @@ def _process_get_calibration_command(packet, sock, addr):
     """
     try:
         cal = calibration.get_calibration()
-        response = {
-            "type": "calibration_response",
-            "seq_ack": packet.get("seq", 0),
-            "calibration": cal.to_dict()
-        }
-        
-        message = json.dumps(response) + "\n"
-        sock.sendto(message.encode(), addr)
+        sock.sendto(_CAL_RESPONSE_TMPL % (packet.get("seq", 0), cal.to_json()), addr)
         debug_print(f"Calibration data sent to {addr}", force=True)
         
     except Exception as e:
@@ -452,27 +1166,29 @@ def _process_set_profile_command(packet, sock, addr, underglow=None, lcd_display
         underglow: Underglow LED controller instance (optional)
         lcd_display: LCD display instance (optional)
     """
+    global _profile_version
     try:
         robot_id = packet.get("robot_id")
         name = packet.get("name", "")
         color = packet.get("color", [255, 255, 255])
         
-        if not name or robot_id is None:
-            response = {
-                "type": "profile_response",
-                "success": False,
-                "message": "Missing robot_id or name"
-            }
-            sock.sendto((json.dumps(response) + "\n").encode(), addr)
+        if not name or robot_id is None or not isinstance(name, str):
+            sock.sendto(_PROFILE_MISSING_RESPONSE, addr)
             return
         
         # Update config (in-memory only - requires reflash for permanent)
-        from config import ROBOT_ID
-        if robot_id == ROBOT_ID:
+        if robot_id == _ROBOT_ID:
+            # Validate the color before any state is changed
+            r, g, b = color
+            if not (type(r) is int and type(g) is int and type(b) is int
+                    and 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+                raise ValueError("color must be three integers 0-255")
+            color_t = (r, g, b)  # Built once, shared by config and underglow
+            
             # Update name and color in config module
-            import config
             config.ROBOT_NAME = name
-            config.ROBOT_COLOR = tuple(color)
+            config.ROBOT_COLOR = color_t
+            _profile_version += 1
             
             debug_print(f"Profile updated: {name} RGB{color}", force=True)
             
@@ -480,8 +1196,8 @@ def _process_set_profile_command(packet, sock, addr, underglow=None, lcd_display
             if underglow:
                 try:
                     # Update the robot_color attribute and set LEDs
-                    underglow.robot_color = tuple(color)
-                    underglow.set_color_all(tuple(color))
+                    underglow.robot_color = color_t
+                    underglow.set_color_all(color_t)
                     debug_print(f"Underglow updated to RGB{color}", force=True)
                 except Exception as e:
                     debug_print(f"Failed to update underglow: {e}", force=True)
@@ -495,38 +1211,35 @@ def _process_set_profile_command(packet, sock, addr, underglow=None, lcd_display
                 except Exception as e:
                     debug_print(f"Failed to update LCD: {e}", force=True)
             
-            response = {
-                "type": "profile_response",
-                "success": True,
-                "message": f"Profile updated: {name} RGB{color}",
-                "robot_id": robot_id,
-                "name": name,
-                "color": color
-            }
+            # The name is escaped once and used in both string fields;
+            # id and color are integers
+            esc_name = json.dumps(name)[1:-1]
+            response = _PROFILE_OK_TMPL % (esc_name, r, g, b, robot_id, esc_name, r, g, b)
         else:
-            response = {
-                "type": "profile_response",
-                "success": False,
-                "message": f"Robot ID mismatch: expected {ROBOT_ID}, got {robot_id}"
-            }
+            response = None
         
         # Send response immediately
         try:
-            response_msg = (json.dumps(response) + "\n").encode()
-            sock.sendto(response_msg, addr)
+            if response is not None:
+                sock.sendto(response, addr)
+            else:
+                _send_json(sock, addr, {
+                    "type": "profile_response",
+                    "success": False,
+                    "message": f"Robot ID mismatch: expected {_ROBOT_ID}, got {robot_id}"
+                })
             debug_print(f"Profile response sent to {addr}", force=True)
         except Exception as e:
             debug_print(f"Failed to send profile response: {e}", force=True)
         
     except Exception as e:
         debug_print(f"Error setting profile: {e}", force=True)
-        response = {
-            "type": "profile_response",
-            "success": False,
-            "message": str(e)
-        }
         try:
-            sock.sendto((json.dumps(response) + "\n").encode(), addr)
+            _send_json(sock, addr, {
+                "type": "profile_response",
+                "success": False,
+                "message": str(e)
+            })
         except:
             pass
 
@@ -535,23 +1248,61 @@ def _process_set_profile_command(packet, sock, addr, underglow=None, lcd_display
 # UDP SERVER (Low Latency)
 # ============================================================================
 
+def _process_control_command(packet, sock, addr, underglow=None, lcd_display=None):
+    """
+    Process a non-drive UDP command (discovery, calibration, profile).
+    
+    Args:
+        packet: Parsed JSON packet
+        sock: UDP socket for responses
+        addr: Client address tuple
+        underglow: Underglow LED controller instance (optional)
+        lcd_display: LCD display instance (optional)
+    """
+    cmd = packet.get("cmd")
+    
+    if cmd == "discover":
+        # Respond to broadcast discovery requests
+        try:
+            sock.sendto(_get_discovery_response(), addr)
+            debug_print(f"Discovery response sent to {addr}", force=True)
+        except Exception as e:
+            debug_print(f"Discovery response error: {e}", force=True)
+    
+    elif cmd == "get_calibration":
+        _process_get_calibration_command(packet, sock, addr)
+    
+    elif cmd == "set_calibration":
+        _process_set_calibration_command(packet)
+    
+    elif cmd == "set_profile":
+        _process_set_profile_command(packet, sock, addr, underglow, lcd_display)
+
+
 async def udp_server(motor_controller, safety_controller, lcd_display, underglow=None):
     """
     Optimized UDP server for low-latency control (fire-and-forget protocol).
     
+    Each wake-up drains every queued datagram. Control commands are handled
+    in arrival order, but only the newest drive command of the batch is
+    applied - older ones are already superseded.
+    
     Args:
         motor_controller: Motor controller instance
         safety_controller: Safety controller instance  
         lcd_display: LCD display instance
         underglow: Underglow LED controller instance (optional)
     """
-    import socket
-    import select
-    
     debug_print("Starting UDP server (low latency mode)", force=True)
     
     # Create UDP socket
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    if _SO_RCVBUF is not None:
+        # Tuning only; the server must come up even if the stack refuses
+        try:
+            sock.setsockopt(_SOL_SOCKET, _SO_RCVBUF, _UDP_RCVBUF_SIZE)
+        except OSError as e:
+            debug_print(f"UDP receive buffer not set: {e}", force=True)
     sock.bind((WEBSOCKET_HOST, WEBSOCKET_PORT))
     sock.setblocking(False)  # Non-blocking for async operation
     
@@ -559,18 +1310,60 @@ async def udp_server(motor_controller, safety_controller, lcd_display, underglow
     
     client_connected = False
     last_seq = 0
+    drive_seq = -1  # seq of the newest drive command accepted
+    drive_addr = None  # Sender of that drive command
+    drive_ms = 0  # When it was accepted (ticks_ms)
     packets_received = 0
     packets_lost = 0
+    motors_enabled = False  # Latched on the first drive command
+    clock = _SenderClock()
+    feed_watchdog = safety_controller.watchdog.feed  # Bound once, skips the SafetyController wrapper
+    motor_drive = motor_controller.drive  # Bound once for the drive path
+    debug_tick = _DEBUG_EVERY  # Drive commands until the next debug line
+    
+    # Encode the discovery reply now rather than on the first broadcast
+    _get_discovery_response()
+    
+    _start_ui_worker(lcd_display)
+    
+    # Receive into one reused buffer where the port supports it (the
+    # parsers and json.loads all accept a memoryview); otherwise fall back
+    # to recvfrom(), which allocates a bytes object per datagram
+    recv_into = getattr(sock, "recvfrom_into", None)
+    if recv_into:
+        rx_buf = bytearray(_UDP_RX_SIZE)
+        rx_mv = memoryview(rx_buf)
+    
+    got_packets = False  # Whether the last drain received anything
     
     # Main receive loop
     while True:
+        if got_packets:
+            # Traffic is flowing: let other tasks run, then drain again
+            # straight away - more packets may have arrived meanwhile
+            await asyncio.sleep(0)
+        else:
+            # Idle: suspend until the socket is readable. The asyncio
+            # scheduler polls registered sockets itself, so there is no
+            # fixed polling interval and no wake-ups while the link is idle.
+            yield asyncio.core._io_queue.queue_read(sock)
+        
         try:
-            # Use select to check if data is available (proper way for non-blocking)
-            ready = select.select([sock], [], [], 0)  # 0 = non-blocking poll
+            have_drive = False
+            ctrl_queue = None
+            got_packets = False
             
-            if ready[0]:  # If socket has data ready
-                # Receive data
-                data, addr = sock.recvfrom(1024)
+            # Drain everything queued since the last wake-up
+            while True:
+                try:
+                    if recv_into:
+                        nbytes, addr = recv_into(rx_buf)
+                        data = rx_mv[:nbytes]
+                    else:
+                        data, addr = sock.recvfrom(_UDP_RX_SIZE)
+                except OSError:
+                    break  # Socket empty
+                got_packets = True
                 
                 if not client_connected:
                     debug_print(f"UDP client connected from {addr}", force=True)
@@ -581,59 +1374,93 @@ async def udp_server(motor_controller, safety_controller, lcd_display, underglow
                         underglow.set_state(STATE_CLIENT_OK)
                 
                 try:
-                    packet = json.loads(data.decode().strip())
+                    first = data[0]
+                    if first == _PROTO_FIXED or first == _PROTO_MSGPACK:
+                        # Binary packets only carry drive commands
+                        if first == _PROTO_FIXED:
+                            cmd_id, seq, ts, throttle, steer = _parse_fixed_drive(data)
+                        else:
+                            cmd_id, seq, ts, throttle, steer = _parse_msgpack_drive(data)
+                        if cmd_id != _CMD_DRIVE:
+                            debug_print("Unsupported binary packet dropped")
+                            continue
+                        packet = None
+                    else:
+                        # Drive packets are scanned in place; everything else is decoded as JSON
+                        cmd_id, seq, ts, throttle, steer = _parse_drive(data)
+                        if cmd_id == _CMD_DRIVE:
+                            packet = None
+                        else:
+                            packet = _json_loads(data)
+                            seq = packet.get("seq", 0)
+                    
+                    # A drive at or just behind the newest seq is already
+                    # superseded; drop it before it can touch the motors
+                    if packet is None:
+                        now = _ticks_ms()
+                        if addr != drive_addr:
+                            # New sender: its seq count and clock are its own
+                            drive_addr = addr
+                            clock = _SenderClock()
+                        elif (0 <= drive_seq - seq < _SEQ_WINDOW
+                              and _ticks_diff(now, drive_ms) <= WATCHDOG_TIMEOUT_MS):
+                            # Duplicate or reordered within the current session
+                            debug_print("Out-of-order drive dropped")
+                            continue
+                        drive_seq = seq
+                        drive_ms = now
                     
                     # Track packet loss
-                    seq = packet.get("seq", 0)
                     if seq > last_seq + 1:
                         packets_lost += seq - last_seq - 1
                     last_seq = seq
                     packets_received += 1
                     
-                    cmd = packet.get("cmd")
-                    if cmd == "discover":
-                        # Respond to broadcast discovery requests
+                    if packet is None:
+                        # Newer drive commands replace older ones in the batch
+                        have_drive = True
+                        drive_ts, drive_throttle, drive_steer = ts, throttle, steer
+                    elif packet.get("cmd") == "drive":
+                        have_drive = True
+                        drive_ts = packet.get("ts", 0)
                         try:
-                            from config import ROBOT_ID, MDNS_HOSTNAME, ROBOT_COLOR
-                            cal = calibration.get_calibration()
-                            response = json.dumps({
-                                "type": "robot_info",
-                                "robot_id": ROBOT_ID,
-                                "hostname": MDNS_HOSTNAME,
-                                "version": "1.0",
-                                "color": list(ROBOT_COLOR),  # RGB tuple as list
-                                "calibration": cal.to_dict()  # Include calibration data
-                            }) + "\n"
-                            sock.sendto(response.encode(), addr)
-                            debug_print(f"Discovery response sent to {addr}", force=True)
-                        except Exception as e:
-                            debug_print(f"Discovery response error: {e}", force=True)
-                        continue
-                    
-                    elif cmd == "get_calibration":
-                        _process_get_calibration_command(packet, sock, addr)
-                        continue
-                    
-                    elif cmd == "set_calibration":
-                        _process_set_calibration_command(packet)
-                        continue
-                    
-                    elif cmd == "set_profile":
-                        _process_set_profile_command(packet, sock, addr, underglow, lcd_display)
-                        continue
-                    
-                    elif cmd == "drive":
-                        if _process_drive_command(packet, motor_controller, safety_controller, lcd_display, underglow, packets_received):
-                            packets_received += 1
+                            axes = packet["axes"]
+                            drive_throttle = axes["throttle"]
+                            drive_steer = axes["steer"]
+                        except KeyError:
+                            drive_throttle = drive_steer = 0.0
+                    else:
+                        if ctrl_queue is None:
+                            ctrl_queue = []
+                        ctrl_queue.append((packet, addr))
                     
                 except Exception as e:
                     debug_print(f"Packet processing error: {e}", force=True)
             
+            # Control commands in arrival order
+            if ctrl_queue:
+                for packet, addr in ctrl_queue:
+                    try:
+                        _process_control_command(packet, sock, addr, underglow, lcd_display)
+                    except Exception as e:
+                        debug_print(f"Packet processing error: {e}", force=True)
+            
+            # Then the freshest drive command (feeds the watchdog once per batch)
+            if have_drive:
+                if not motors_enabled:
+                    _enable_motors(motor_controller, underglow)
+                    motors_enabled = True
+                if _process_drive_fast(drive_ts, drive_throttle, drive_steer, motor_drive, feed_watchdog, clock, _UDP_MAX_AGE_MS):
+                    # DEBUG: Print every _DEBUG_EVERY drive commands (skipped
+                    # entirely in production builds)
+                    if DEBUG_MODE:
+                        debug_tick -= 1
+                        if not debug_tick:
+                            debug_tick = _DEBUG_EVERY
+                            debug_print(f"Drive cmd: T={drive_throttle:.2f} S={drive_steer:.2f} PKT={packets_received}")
+            
         except Exception as e:
             debug_print(f"UDP receive error: {e}", force=True)
-        
-        # Yield control to other tasks
-        await asyncio.sleep_ms(1)  # 1ms yield for better responsiveness
 
 
 async def handle_tcp_client(reader, writer, motor_controller, safety_controller, lcd_display):
@@ -650,41 +1477,68 @@ async def handle_tcp_client(reader, writer, motor_controller, safety_controller,
     addr = writer.get_extra_info('peername')
     debug_print(f"TCP client connected from {addr}", force=True)
     
-    # Enable TCP_NODELAY for low latency (if supported)
-    # Note: MicroPython may not support all socket options
-    try:
-        import socket
-        sock = writer.get_extra_info('socket')
-        if sock and hasattr(socket, 'TCP_NODELAY'):
-            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-            debug_print("TCP_NODELAY enabled", force=True)
-    except (AttributeError, OSError) as e:
-        # MicroPython doesn't support TCP_NODELAY, continue anyway
-        debug_print(f"TCP_NODELAY not available: {e}")
-    
-    if lcd_display:
-        lcd_display.set_state(STATE_CLIENT_OK)
+    motors_enabled = False  # Latched on this connection's first drive command
+    clock = _SenderClock()
+    feed_watchdog = safety_controller.watchdog.feed  # Bound once, skips the SafetyController wrapper
+    motor_drive = motor_controller.drive  # Bound once for the drive path
+    
+    # Per-connection receive buffer; lines are passed on as memoryview
+    # slices (see _LineFramer)
+    framer = _LineFramer()
     
     try:
-        while True:
-            data = await reader.readline()
-            if not data:
-                break
-            
+        # Enable TCP_NODELAY for low latency and fix the buffer sizes.
+        # Support was resolved at import, so only available options are
+        # set; a refusal only costs the tuning, not the connection.
+        # Note: uasyncio's Stream keeps the socket in .s (get_extra_info
+        # only knows "peername")
+        sock = getattr(writer, "s", None)
+        if sock is not None:
             try:
-                packet = json.loads(data.decode().strip())
-                
-                cmd = packet.get("cmd")
-                if cmd == "drive":
-                    # Use consolidated handler (with 200ms max age for TCP)
-                    if not _process_drive_command(packet, motor_controller, safety_controller, lcd_display, None, 0, max_age_ms=200):
-                        continue  # Skip stale command, don't feed watchdog
+                if _TCP_NODELAY is not None:
+                    sock.setsockopt(_IPPROTO_TCP, _TCP_NODELAY, 1)
+                if _SO_RCVBUF is not None:
+                    sock.setsockopt(_SOL_SOCKET, _SO_RCVBUF, _TCP_BUF_SIZE)
+                if _SO_SNDBUF is not None:
+                    sock.setsockopt(_SOL_SOCKET, _SO_SNDBUF, _TCP_BUF_SIZE)
+            except OSError as e:
+                debug_print(f"TCP socket options not set: {e}", force=True)
+        
+        if lcd_display:
+            lcd_display.set_state(STATE_CLIENT_OK)
+        _start_ui_worker(lcd_display)
+        
+        while await framer.read(reader):
+            # Handle every complete line from this read
+            while True:
+                data = framer.next_line()
+                if data is None:
+                    break
                 
-                # No ACK needed - fire and forget for maximum performance
-                # Removing ACK reduces latency significantly
+                try:
+                    # Drive packets are scanned in place; anything else is
+                    # decoded as JSON
+                    cmd_id, seq, ts, throttle, steer = _parse_drive(data)
+                    if cmd_id == _CMD_DRIVE:
+                        packet = None
+                    else:
+                        packet = _json_loads(data)
+                        if packet.get("cmd") != "drive":
+                            continue  # Only drive commands are handled over TCP
+                    
+                    if not motors_enabled:
+                        _enable_motors(motor_controller)
+                        motors_enabled = True
+                    
+                    # Use consolidated handler (with the shorter TCP max age).
+                    # No ACK - fire and forget for lowest latency.
+                    if packet is None:
+                        _process_drive_fast(ts, throttle, steer, motor_drive, feed_watchdog, clock, _TCP_MAX_AGE_MS)
+                    else:
+                        _process_drive_command(packet, motor_drive, feed_watchdog, clock, _TCP_MAX_AGE_MS)
                 
-            except Exception as e:
-                debug_print(f"Packet processing error: {e}")
+                except Exception as e:
+                    debug_print(f"Packet processing error: {e}")
     
     except Exception as e:
         debug_print(f"Client error: {e}", force=True)
@@ -696,7 +1550,8 @@ async def handle_tcp_client(reader, writer, motor_controller, safety_controller,
         motor_controller.stop()
         debug_print("Motors stopped due to disconnect")
         
-        # Update display to show link lost
+        # Update display to show link lost (dropping any pending drive update)
+        _ui_event.clear()
         if lcd_display:
             lcd_display.set_state(STATE_LINK_LOST)
         